@@ -7,20 +7,28 @@
 # - Transcript upload and AI verification (Phase 2)
 # Note: Auth is handled by Supabase, not this API
 
-from fastapi import FastAPI, Depends, HTTPException, Header, Query, UploadFile, File
+from fastapi import FastAPI, Depends, HTTPException, Header, Query, Request, Response, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Iterable, Iterator
 import os
 import base64
+import hashlib
 import json
-import uuid
 import io
-from datetime import datetime
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
 from supabase import create_client, Client
+from storage3.utils import StorageException
 from jose import jwt, JWTError
-from openai import OpenAI
+from openai import OpenAI, APIConnectionError, APIStatusError, RateLimitError
 
 # Try to import PyMuPDF for PDF support, but make it optional
 try:
@@ -30,12 +38,61 @@ except ImportError:
     PDF_SUPPORT = False
     print("Warning: PyMuPDF not installed. PDF uploads will be rejected. Install with: pip install pymupdf")
 
+# Try to import orjson for faster JSON responses, falling back to the stdlib encoder
+try:
+    import orjson  # noqa: F401
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+    print("Warning: orjson not installed. Falling back to the standard JSON encoder. Install with: pip install orjson")
+
 load_dotenv()
 
 # ---------------------------
 # App & CORS
 # ---------------------------
-app = FastAPI(title="TutorLink API (MVP)")
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware that leaves streamed media types uncompressed.
+    GZipMiddleware buffers streamed bodies inside its GzipFile and only emits
+    them when the buffer fills, so NDJSON rows would be held back; these
+    responses trade compression for rows arriving as they're built.
+    """
+
+    def __init__(self, app, minimum_size: int = 500, compresslevel: int = 9, exclude_media_types: tuple = ()):
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.exclude_media_types = exclude_media_types
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = _StreamingAwareGZipResponder(
+                self.app, self.minimum_size, self.compresslevel, self.exclude_media_types
+            )
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+class _StreamingAwareGZipResponder(GZipResponder):
+    def __init__(self, app, minimum_size: int, compresslevel: int, exclude_media_types: tuple):
+        super().__init__(app, minimum_size, compresslevel=compresslevel)
+        self.exclude_media_types = exclude_media_types
+        self.passthrough = False
+
+    async def send_with_gzip(self, message):
+        if message["type"] == "http.response.start":
+            media_type = Headers(raw=message["headers"]).get("content-type", "").split(";")[0].strip()
+            self.passthrough = media_type in self.exclude_media_types
+        if self.passthrough:
+            await self.send(message)
+            return
+        await super().send_with_gzip(message)
+
+
+app = FastAPI(
+    title="TutorLink API (MVP)",
+    default_response_class=ORJSONResponse if ORJSON_SUPPORT else JSONResponse,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -43,6 +100,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Compress large payloads (tutor listings, help request lists) when the client sends Accept-Encoding: gzip.
+# NDJSON streams are sent uncompressed so their rows aren't held back
+app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=1024, exclude_media_types=("application/x-ndjson",))
 
 @app.get("/")
 def home():
@@ -81,6 +141,59 @@ else:
 MAX_TRANSCRIPT_SIZE = 10 * 1024 * 1024  # 10MB
 ALLOWED_TRANSCRIPT_TYPES = ["application/pdf", "image/png", "image/jpeg", "image/jpg"]
 TRANSCRIPT_BUCKET = "transcripts"
+# Transcripts are stored under their content hash so identical files share one object
+TRANSCRIPT_HASH_PREFIX = "sha256"
+TRANSCRIPT_EXTENSIONS = {"application/pdf": "pdf", "image/png": "png", "image/jpeg": "jpg", "image/jpg": "jpg"}
+# OpenAI call layer: per-attempt deadline, retries with jittered backoff, circuit breaker, hedging
+OPENAI_TIMEOUT_SECONDS = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "60"))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "3"))
+OPENAI_BACKOFF_BASE_SECONDS = 0.5
+OPENAI_BACKOFF_MAX_SECONDS = 8.0
+OPENAI_BREAKER_THRESHOLD = 5  # Consecutive failed attempts before the breaker opens
+OPENAI_BREAKER_RESET_SECONDS = 30.0
+# Send a duplicate request if the first hasn't answered after this long (0 = no hedging)
+OPENAI_HEDGE_AFTER_SECONDS = float(os.getenv("OPENAI_HEDGE_AFTER_SECONDS", "0"))
+# Threads for hedged calls: each in-flight verification can use two (request + hedge), so this
+# should be at least twice the concurrent verify calls. The default covers the API's 40-thread
+# sync endpoint pool; add 2x reverify.py --concurrency when that runs in the same process
+OPENAI_HEDGE_POOL_SIZE = int(os.getenv("OPENAI_HEDGE_POOL_SIZE", "80"))
+# Transcript verification cascade: a cheap first pass, escalating to the full model when uncertain
+VERIFY_CASCADE = os.getenv("VERIFY_CASCADE", "true").lower() in ("1", "true", "yes")
+# The first pass must be cheaper for image input, not just per token: gpt-4o-mini bills a
+# high-detail image at ~33x gpt-4o's image tokens, so it costs more than the full pass.
+# gpt-4.1-mini bills images by 32px patches (capped at 1536, x1.62) at $0.40/M: ~2.5k tokens for a
+# rendered transcript page, about half of gpt-4o's ~765 high-detail tokens at $2.50/M. Check the
+# escalation rate and spend against transcript_verifications before relying on it (see README)
+VERIFY_FIRST_PASS_MODEL = os.getenv("VERIFY_FIRST_PASS_MODEL", "gpt-4.1-mini")
+# High detail by default: at low detail a transcript page is downscaled until grades are barely
+# legible, and confident first-pass results are kept without escalation
+VERIFY_FIRST_PASS_DETAIL = os.getenv("VERIFY_FIRST_PASS_DETAIL", "high")
+VERIFY_FULL_MODEL = os.getenv("VERIFY_FULL_MODEL", "gpt-4o")
+VERIFY_FULL_DETAIL = os.getenv("VERIFY_FULL_DETAIL", "high")
+# Escalate when the first pass's authenticity_score falls in this band (the cutoff is 0.7)
+VERIFY_ESCALATE_AUTHENTICITY = (
+    float(os.getenv("VERIFY_ESCALATE_AUTHENTICITY_MIN", "0.6")),
+    float(os.getenv("VERIFY_ESCALATE_AUTHENTICITY_MAX", "0.8")),
+)
+# Escalate when a matched course's grade points are this close to the B+ (3.3) cutoff and no
+# other course in the same subject clearly clears it
+VERIFY_ESCALATE_GRADE_MARGIN = float(os.getenv("VERIFY_ESCALATE_GRADE_MARGIN", "0.3"))
+# USD per million (input, output) tokens, for the cost recorded with each verification
+OPENAI_PRICES_PER_MILLION = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4.1-mini": (0.40, 1.60),
+}
+# Upper bounds (seconds) of the tutor_stats response-time histogram buckets; the last bucket is open-ended.
+# Keep in sync with response_time_bucket() in supabase-schema.sql
+RESPONSE_TIME_BUCKETS = [900, 3600, 14400, 43200, 86400, 259200, 604800]
+TUTOR_STATS_COLUMNS = "total_requests, pending_count, accepted_count, declined_count, closed_count, responded_count, accepted_responses, response_time_histogram"
+# Directory sync versions trail the clock by this much. updated_at is the writing transaction's
+# start time, so a write committing after a poll can carry an earlier timestamp; re-sending the
+# last few seconds of changes lets clients pick it up. Transactions slower than this can still be missed.
+DIRECTORY_SYNC_LAG_SECONDS = float(os.getenv("DIRECTORY_SYNC_LAG_SECONDS", "30"))
+# How long identical public reads reuse a just-fetched result (0 = only share in-flight fetches)
+READ_MICROCACHE_MS = int(os.getenv("READ_MICROCACHE_MS", "0"))
 
 # ---------------------------
 # Auth - Verify Supabase JWT
@@ -196,101 +309,696 @@ class HelpReqIn(BaseModel):
 class HelpReqUpdate(BaseModel):
     status: str  # "pending" | "accepted" | "declined" | "closed"
 
+class TutorStatsOut(BaseModel):
+    total_requests: int = 0
+    pending: int = 0
+    accepted: int = 0
+    declined: int = 0
+    closed: int = 0
+    acceptance_rate: Optional[float] = None  # Accepted share of requests the tutor responded to
+    median_response_seconds: Optional[float] = None  # Estimated from the response-time histogram
+
+class TutorSummaryOut(BaseModel):
+    tutor_id: str
+    name: str
+    bio: str = ""
+    subjects: list[str] = []
+    availability: list[str] = []
+    is_verified: bool = False
+    stats: Optional[TutorStatsOut] = None
+
+class RankedTutorOut(TutorSummaryOut):
+    grade_points: float = 0
+    responsiveness: float = 0
+
+class DirectorySnapshotOut(BaseModel):
+    version: str  # Opaque; pass as ?since= to /tutors/changes
+    tutors: list[TutorSummaryOut] = []
+
+class DirectoryChangesOut(BaseModel):
+    version: str
+    updated: list[TutorSummaryOut] = []
+    removed: list[str] = []  # Tutor ids to drop from the local copy
+
+class TutorDetailOut(BaseModel):
+    tutor_id: str
+    name: str
+    bio: str = ""
+    subjects: list[str] = []
+    availability: list[str] = []
+    scheduling_link: Optional[str] = None
+    is_verified: bool = False
+    transcript_verification_status: Optional[str] = None
+    transcript_verified_at: Optional[str] = None
+    stats: Optional[TutorStatsOut] = None
+
+class HelpReqOut(BaseModel):
+    id: str
+    subject: str
+    description: str = ""
+    status: str
+    preferred_times: list[str] = []
+    created_at: Optional[str] = None
+    # Only the counterpart's fields are set, depending on the role the list is viewed as
+    tutor_id: Optional[str] = None
+    tutor_name: Optional[str] = None
+    student_id: Optional[str] = None
+    student_name: Optional[str] = None
+
+# JSON schema the verification model must answer with (OpenAI structured outputs)
+TRANSCRIPT_VERIFICATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "verified_courses": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "course_name": {"type": "string"},
+                    "grade": {"type": "string"},
+                    "grade_points": {"type": ["number", "null"]},
+                    "matches_subject": {"type": ["string", "null"]},
+                },
+                "required": ["course_name", "grade", "grade_points", "matches_subject"],
+                "additionalProperties": False,
+            },
+        },
+        "authenticity_score": {"type": "number"},
+        "authenticity_notes": {"type": "string"},
+        "overall_status": {"type": "string", "enum": ["verified", "rejected"]},
+        "rejection_reason": {"type": ["string", "null"]},
+        "summary": {"type": "string"},
+    },
+    "required": [
+        "verified_courses", "authenticity_score", "authenticity_notes",
+        "overall_status", "rejection_reason", "summary",
+    ],
+    "additionalProperties": False,
+}
+
+# ---------------------------
+# Helper: NDJSON Streaming
+# ---------------------------
+def ndjson_response(rows: Iterable[BaseModel]) -> StreamingResponse:
+    """
+    Stream models as newline-delimited JSON, one object per line.
+    Rows are serialized as they are produced, so the first ones leave the
+    server before the last ones are built.
+    """
+    def generate() -> Iterator[str]:
+        for row in rows:
+            yield row.model_dump_json(exclude_unset=True) + "\n"
+
+    # Left uncompressed by StreamingAwareGZipMiddleware
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+# ---------------------------
+# Helper: Request Coalescing
+# ---------------------------
+class SharedFetchError(Exception):
+    """Raised in a SingleFlight follower when the leader's fetch failed (chained to its exception)."""
+
+
+class SingleFlight:
+    """
+    Collapse identical concurrent reads into one backend fetch.
+    The first caller for a key runs the fetch; callers arriving while it is
+    in flight wait and share its result, or get a SharedFetchError chained to
+    its exception. With a TTL, the result is also reused for that long after
+    the fetch completes.
+    Shared results must be treated as read-only by callers.
+    """
+    MAX_CACHED_KEYS = 1024
+
+    def __init__(self, ttl_seconds: float = 0):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._in_flight: dict = {}
+        self._cache: dict = {}
+
+    def do(self, key, fetch):
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+            
+            call = self._in_flight.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = {"done": threading.Event(), "result": None, "error": None}
+                self._in_flight[key] = call
+        
+        if not is_leader:
+            call["done"].wait()
+            if call["error"] is not None:
+                # A fresh exception per follower; re-raising the leader's instance
+                # from every thread would keep appending to its traceback
+                raise SharedFetchError(str(call["error"])) from call["error"]
+            return call["result"]
+        
+        try:
+            call["result"] = fetch()
+            return call["result"]
+        except Exception as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+                if call["error"] is None and self.ttl_seconds > 0:
+                    self._store(key, call["result"])
+            call["done"].set()
+
+    def _store(self, key, result):
+        # Caller holds the lock
+        now = time.monotonic()
+        if len(self._cache) >= self.MAX_CACHED_KEYS:
+            self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+        if len(self._cache) < self.MAX_CACHED_KEYS:
+            self._cache[key] = (now + self.ttl_seconds, result)
+
+read_coalescer = SingleFlight(ttl_seconds=READ_MICROCACHE_MS / 1000)
+
+# ---------------------------
+# Helper: Resilient OpenAI Calls
+# ---------------------------
+class CircuitBreaker:
+    """
+    Fail fast while a dependency is down.
+    Opens after `failure_threshold` consecutive failures; once `reset_seconds`
+    have passed, a single probe call is let through (half-open). Its success
+    closes the breaker, its failure re-opens it. A probe that never reports
+    back frees the slot for another after `reset_seconds`.
+    """
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_at: Optional[float] = None
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at < self.reset_seconds:
+                return False
+            if self._probe_at is not None and now - self._probe_at < self.reset_seconds:
+                return False
+            self._probe_at = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._probe_at = None
+
+openai_breaker = CircuitBreaker(OPENAI_BREAKER_THRESHOLD, OPENAI_BREAKER_RESET_SECONDS)
+openai_hedge_pool = ThreadPoolExecutor(max_workers=OPENAI_HEDGE_POOL_SIZE, thread_name_prefix="openai-hedge")
+
+class HedgeExpired(Exception):
+    """The hedge started after the attempt's deadline had already passed."""
+
+class HedgePoolTimeout(Exception):
+    """No openai_hedge_pool thread freed up within OPENAI_TIMEOUT_SECONDS."""
+
+def is_retryable_openai_error(error: Exception) -> bool:
+    """Timeouts, connection errors, 429s and 5xx are worth retrying; other 4xx are not."""
+    if isinstance(error, (APIConnectionError, RateLimitError, HedgePoolTimeout)):
+        return True
+    return isinstance(error, APIStatusError) and error.status_code >= 500
+
+def hedged(call):
+    """
+    Run `call(timeout)`, starting a duplicate if it hasn't finished within
+    OPENAI_HEDGE_AFTER_SECONDS, and return whichever succeeds first.
+    Both share one OPENAI_TIMEOUT_SECONDS deadline counted from when the first
+    request actually starts, so time queued for a pool thread doesn't trigger
+    hedges and the hedge only gets what's left of the deadline. Waiting for
+    that thread is bounded too: HedgePoolTimeout (retryable) after
+    OPENAI_TIMEOUT_SECONDS.
+    """
+    if OPENAI_HEDGE_AFTER_SECONDS <= 0:
+        return call(OPENAI_TIMEOUT_SECONDS)
+    
+    started = threading.Event()
+    deadline = {}
+    
+    def first_request():
+        deadline["at"] = time.monotonic() + OPENAI_TIMEOUT_SECONDS
+        started.set()
+        return call(OPENAI_TIMEOUT_SECONDS)
+    
+    def hedge_request():
+        remaining = deadline["at"] - time.monotonic()
+        if remaining <= 0:
+            raise HedgeExpired()
+        return call(remaining)
+    
+    first = openai_hedge_pool.submit(first_request)
+    # A saturated pool must not queue the call outside any deadline
+    if not started.wait(OPENAI_TIMEOUT_SECONDS) and first.cancel():
+        raise HedgePoolTimeout(f"No thread free for an OpenAI call within {OPENAI_TIMEOUT_SECONDS}s")
+    started.wait()
+    pending = {first}
+    hedge_at = deadline["at"] - OPENAI_TIMEOUT_SECONDS + OPENAI_HEDGE_AFTER_SECONDS
+    done, pending = wait(pending, timeout=max(0, hedge_at - time.monotonic()))
+    if not done:
+        pending.add(openai_hedge_pool.submit(hedge_request))
+    
+    error = None
+    while done or pending:
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+            if not isinstance(future.exception(), HedgeExpired):
+                error = future.exception()
+        if not pending:
+            break
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+    raise error
+
+def create_chat_completion(**kwargs):
+    """
+    Call chat.completions.create with a per-attempt deadline, jittered
+    exponential backoff on retryable errors and a shared circuit breaker.
+    Raises HTTPException(503) when OpenAI stays unavailable.
+    """
+    if not openai_breaker.allow():
+        raise HTTPException(status_code=503, detail="OpenAI is temporarily unavailable. Please try again shortly.")
+    
+    last_error: Optional[Exception] = None
+    
+    for attempt in range(OPENAI_MAX_RETRIES + 1):
+        try:
+            response = hedged(
+                lambda timeout: openai_client.with_options(timeout=timeout, max_retries=0).chat.completions.create(**kwargs)
+            )
+            openai_breaker.record_success()
+            return response
+        except Exception as e:
+            if not is_retryable_openai_error(e):
+                raise
+            last_error = e
+            if not isinstance(e, HedgePoolTimeout):
+                # Local thread starvation says nothing about OpenAI's health
+                openai_breaker.record_failure()
+        
+        if attempt == OPENAI_MAX_RETRIES or not openai_breaker.allow():
+            break
+        # Full jitter keeps retries from many workers from lining up
+        backoff = min(OPENAI_BACKOFF_MAX_SECONDS, OPENAI_BACKOFF_BASE_SECONDS * (2 ** attempt))
+        time.sleep(random.uniform(0, backoff))
+    
+    raise HTTPException(status_code=503, detail=f"OpenAI is unavailable: {str(last_error)}")
+
+# ---------------------------
+# Helper: Tutor Stats
+# ---------------------------
+def median_from_histogram(histogram: List[int]) -> Optional[float]:
+    """
+    Estimate the median response time from histogram bucket counts,
+    interpolating linearly within the bucket that holds the median.
+    """
+    total = sum(histogram)
+    if total <= 0:
+        return None
+    
+    target = total / 2
+    seen = 0
+    for i, count in enumerate(histogram):
+        if count > 0 and seen + count >= target:
+            lower = RESPONSE_TIME_BUCKETS[i - 1] if i > 0 else 0
+            if i >= len(RESPONSE_TIME_BUCKETS):
+                # Open-ended last bucket: all we know is the lower bound
+                return float(lower)
+            upper = RESPONSE_TIME_BUCKETS[i]
+            return lower + (upper - lower) * (target - seen) / count
+        seen += count
+    return None
+
+def tutor_stats_out(profile: Optional[dict]) -> Optional[TutorStatsOut]:
+    """
+    Build stats from a profiles row with an embedded tutor_stats row.
+    Returns None if stats weren't selected, zeros if the tutor has no requests yet.
+    """
+    if not profile or "tutor_stats" not in profile:
+        return None
+    
+    row = profile.get("tutor_stats")
+    # PostgREST embeds one-to-one relations as an object, older versions as a list
+    if isinstance(row, list):
+        row = row[0] if row else None
+    if not row:
+        return TutorStatsOut()
+    
+    responded = row.get("responded_count") or 0
+    return TutorStatsOut(
+        total_requests=row.get("total_requests") or 0,
+        pending=row.get("pending_count") or 0,
+        accepted=row.get("accepted_count") or 0,
+        declined=row.get("declined_count") or 0,
+        closed=row.get("closed_count") or 0,
+        acceptance_rate=(row.get("accepted_responses") or 0) / responded if responded else None,
+        median_response_seconds=median_from_histogram(row.get("response_time_histogram") or []),
+    )
+
+# Sort keys for ranking search results by stats; tutors without data sort last
+TUTOR_STATS_SORTS = {
+    "acceptance_rate": lambda t: (t.stats is None or t.stats.acceptance_rate is None, -(t.stats.acceptance_rate or 0) if t.stats else 0),
+    "response_time": lambda t: (t.stats is None or t.stats.median_response_seconds is None, (t.stats.median_response_seconds or 0) if t.stats else 0),
+    "requests": lambda t: -(t.stats.total_requests if t.stats else 0),
+}
+
 # ---------------------------
 # Tutor Profile Endpoints
 # ---------------------------
-@app.get("/tutors/search")
+def iter_tutor_matches(
+    rows: list,
+    subject: Optional[str],
+    availability: Optional[str],
+) -> Iterator[TutorSummaryOut]:
+    """
+    Yield tutors whose subjects/availability match the search terms.
+    Matching is non-strict: the term may appear anywhere in any entry.
+    """
+    subject_lower = subject.lower().strip() if subject else None
+    availability_lower = availability.lower().strip() if availability else None
+    
+    for tp in rows:
+        subjects_list = tp.get("subjects") or []
+        availability_list = tp.get("availability") or []
+        
+        # Non-strict subject matching: check if search term appears anywhere in any subject
+        if subject_lower:
+            subject_matches = any(
+                subject_lower in s.lower() for s in subjects_list
+            )
+            if not subject_matches:
+                continue
+        
+        # Non-strict availability matching: check if search term appears anywhere in any availability entry
+        if availability_lower:
+            availability_matches = any(
+                availability_lower in av.lower() for av in availability_list
+            )
+            if not availability_matches:
+                continue
+        
+        yield TutorSummaryOut(
+            tutor_id=tp["id"],
+            name=(tp.get("profiles") or {}).get("name", "Unknown"),
+            bio=tp.get("bio") or "",
+            subjects=subjects_list,
+            availability=availability_list,
+            is_verified=tp.get("transcript_verification_status") == "verified",
+            stats=tutor_stats_out(tp.get("profiles")),
+        )
+
+@app.get("/tutors/search", response_model=List[TutorSummaryOut])
 def search_tutors(
     subject: Optional[str] = None,
     availability: Optional[str] = None,
     verified_only: bool = Query(False, description="Only show verified tutors"),
+    sort: Optional[str] = Query(None, description="Rank by 'acceptance_rate', 'response_time' or 'requests'"),
+    stream: bool = Query(False, description="Stream results as NDJSON (one tutor per line)"),
 ):
     """
     Search for tutors with non-strict (fuzzy) matching.
     Filters by subject and/or availability using partial matching.
-    Returns public tutor profile information.
+    Returns public tutor profile information and help request stats.
     """
     if not supabase:
         raise HTTPException(status_code=500, detail="Supabase not configured")
     
-    try:
-        # Query tutor_profiles joined with profiles
+    if sort and sort not in TUTOR_STATS_SORTS:
+        raise HTTPException(status_code=400, detail=f"Invalid sort. Must be one of: {list(TUTOR_STATS_SORTS)}")
+    
+    def fetch_tutors() -> list:
+        # Query tutor_profiles joined with profiles and their precomputed stats
         query = supabase.table("tutor_profiles").select(
-            "id, bio, subjects, availability, scheduling_link, transcript_verification_status, profiles(name)"
+            f"id, bio, subjects, availability, scheduling_link, transcript_verification_status, profiles(name, tutor_stats({TUTOR_STATS_COLUMNS}))"
         )
         
         # Filter by verification status if requested
         if verified_only:
             query = query.eq("transcript_verification_status", "verified")
         
-        response = query.execute()
-        
-        results = []
-        subject_lower = subject.lower().strip() if subject else None
-        availability_lower = availability.lower().strip() if availability else None
+        return query.execute().data
+    
+    try:
+        # Subject/availability filtering happens in Python, so every search with the
+        # same verified_only flag shares one Supabase fetch during bursts
+        rows = read_coalescer.do(("tutor_search", verified_only), fetch_tutors)
         
-        for tp in response.data:
-            subjects_list = tp.get("subjects") or []
-            availability_list = tp.get("availability") or []
-            
-            # Non-strict subject matching: check if search term appears anywhere in any subject
-            if subject_lower:
-                subject_matches = any(
-                    subject_lower in s.lower() for s in subjects_list
-                )
-                if not subject_matches:
-                    continue
-            
-            # Non-strict availability matching: check if search term appears anywhere in any availability entry
-            if availability_lower:
-                availability_matches = any(
-                    availability_lower in av.lower() for av in availability_list
-                )
-                if not availability_matches:
-                    continue
-            
-            results.append({
-                "tutor_id": tp["id"],
-                "name": tp.get("profiles", {}).get("name", "Unknown"),
-                "bio": tp.get("bio", ""),
-                "subjects": subjects_list,
-                "availability": availability_list,
-                "is_verified": tp.get("transcript_verification_status") == "verified",
-            })
+        matches = iter_tutor_matches(rows, subject, availability)
+        if sort:
+            matches = sorted(matches, key=TUTOR_STATS_SORTS[sort])
+        if stream:
+            return ndjson_response(matches)
         
-        return results
+        return list(matches)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching tutors: {str(e)}")
 
-@app.get("/tutors/{tutor_id}")
+# ---------------------------
+# Tutor Directory Sync Endpoints
+# ---------------------------
+DIRECTORY_COLUMNS = "id, bio, subjects, availability, transcript_verification_status, updated_at, profiles(name)"
+
+def timestamp_version(timestamp: str) -> int:
+    """Turn a Postgres timestamptz string into a directory version (UTC epoch microseconds)."""
+    moment = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    delta = moment - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+def version_timestamp(version: int) -> str:
+    """The UTC timestamp a directory version stands for, for querying updated_at/deleted_at."""
+    return (datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(microseconds=version)).isoformat()
+
+def directory_version(latest_change: Optional[str]) -> str:
+    """
+    Version to hand back to clients: the latest change seen, but never later
+    than DIRECTORY_SYNC_LAG_SECONDS ago (see the setting for why). An empty
+    directory gets the cutoff itself, so clients always have a version to poll with.
+    Versions are opaque digit strings (epoch microseconds), safe to put in a
+    URL without encoding.
+    """
+    cutoff = int((time.time() - DIRECTORY_SYNC_LAG_SECONDS) * 1_000_000)
+    if latest_change is None:
+        return str(cutoff)
+    return str(min(timestamp_version(latest_change), cutoff))
+
+def latest_tombstone() -> Optional[str]:
+    rows = supabase.table("tutor_profile_tombstones").select("deleted_at").order(
+        "deleted_at", desc=True
+    ).limit(1).execute().data
+    return rows[0]["deleted_at"] if rows else None
+
+def directory_etag(request: Request, response: Response, latest_change: Optional[str], max_age: int) -> bool:
+    """
+    Set caching headers for a directory response keyed on its latest change
+    (profile update or removal).
+    Returns True if the client's If-None-Match already has this version.
+    """
+    etag = f'"{timestamp_version(latest_change) if latest_change else "empty"}"'
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = f"public, max-age={max_age}, stale-while-revalidate={max_age * 5}"
+    return request.headers.get("if-none-match") == etag
+
+@app.get("/tutors/snapshot", response_model=DirectorySnapshotOut, response_model_exclude_none=True)
+def get_directory_snapshot(request: Request, response: Response):
+    """
+    Get the full public tutor directory with its version.
+    Clients keep the result locally and then poll /tutors/changes?since=<version>.
+    Cacheable by CDNs; the ETag changes whenever a profile is updated or removed.
+    """
+    if not supabase:
+        raise HTTPException(status_code=500, detail="Supabase not configured")
+    
+    try:
+        rows, removed_at = read_coalescer.do(
+            ("tutor_snapshot",),
+            lambda: (
+                supabase.table("tutor_profiles").select(DIRECTORY_COLUMNS).execute().data,
+                latest_tombstone(),
+            ),
+        )
+        latest_change = max(
+            [tp["updated_at"] for tp in rows if tp.get("updated_at")] + ([removed_at] if removed_at else []),
+            key=timestamp_version,
+            default=None,
+        )
+        version = directory_version(latest_change)
+        
+        if directory_etag(request, response, latest_change, max_age=60):
+            return Response(status_code=304, headers=dict(response.headers))
+        
+        return DirectorySnapshotOut(
+            version=version,
+            tutors=list(iter_tutor_matches(rows, None, None)),
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error getting tutor directory: {str(e)}")
+
+@app.get("/tutors/changes", response_model=DirectoryChangesOut, response_model_exclude_none=True)
+def get_directory_changes(
+    request: Request,
+    response: Response,
+    since: str = Query(..., pattern=r"^\d{1,18}$", description="Version from a previous snapshot or changes response"),
+):
+    """
+    Get tutors updated or removed since a directory version.
+    Apply 'removed' before 'updated'. Versions trail the latest change by up to
+    DIRECTORY_SYNC_LAG_SECONDS, so recent changes are sent again on the next
+    poll; applying them twice is harmless.
+    """
+    if not supabase:
+        raise HTTPException(status_code=500, detail="Supabase not configured")
+    
+    try:
+        since_at = version_timestamp(int(since))
+    except OverflowError:
+        raise HTTPException(status_code=400, detail="Invalid version")
+    
+    try:
+        updated_rows = supabase.table("tutor_profiles").select(DIRECTORY_COLUMNS).gte(
+            "updated_at", since_at
+        ).order("updated_at").execute().data
+        removed_rows = supabase.table("tutor_profile_tombstones").select("tutor_id, deleted_at").gte(
+            "deleted_at", since_at
+        ).execute().data
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error getting directory changes: {str(e)}")
+    
+    latest_change = max(
+        [tp["updated_at"] for tp in updated_rows if tp.get("updated_at")]
+        + [t["deleted_at"] for t in removed_rows],
+        key=timestamp_version,
+        default=None,
+    )
+    # Never move a client's cursor backwards
+    version = str(max(int(since), int(directory_version(latest_change)))) if latest_change else str(int(since))
+    
+    if directory_etag(request, response, latest_change, max_age=10):
+        return Response(status_code=304, headers=dict(response.headers))
+    
+    return DirectoryChangesOut(
+        version=version,
+        updated=list(iter_tutor_matches(updated_rows, None, None)),
+        removed=[t["tutor_id"] for t in removed_rows],
+    )
+
+@app.get("/tutors/{tutor_id}", response_model=TutorDetailOut)
 def get_tutor(tutor_id: str):
     """Get a specific tutor's public profile including verification status."""
     if not supabase:
         raise HTTPException(status_code=500, detail="Supabase not configured")
     
+    # Normalized once so the coalescing key and the query always agree
+    tutor_id = tutor_id.strip().lower()
+    
+    def fetch_tutor() -> dict:
+        return supabase.table("tutor_profiles").select(
+            f"id, bio, subjects, availability, scheduling_link, transcript_verification_status, transcript_verified_at, profiles(name, phone, tutor_stats({TUTOR_STATS_COLUMNS}))"
+        ).eq("id", tutor_id).single().execute().data
+    
     try:
-        response = supabase.table("tutor_profiles").select(
-            "id, bio, subjects, availability, scheduling_link, transcript_verification_status, transcript_verified_at, profiles(name, phone)"
-        ).eq("id", tutor_id).single().execute()
-        
-        tp = response.data
-        return {
-            "tutor_id": tp["id"],
-            "name": tp.get("profiles", {}).get("name", "Unknown"),
-            "bio": tp.get("bio", ""),
-            "subjects": tp.get("subjects") or [],
-            "availability": tp.get("availability") or [],
-            "scheduling_link": tp.get("scheduling_link"),
-            "is_verified": tp.get("transcript_verification_status") == "verified",
-            "transcript_verification_status": tp.get("transcript_verification_status"),
-            "transcript_verified_at": tp.get("transcript_verified_at"),
-        }
+        tp = read_coalescer.do(("tutor", tutor_id), fetch_tutor)
+        return TutorDetailOut(
+            tutor_id=tp["id"],
+            name=(tp.get("profiles") or {}).get("name", "Unknown"),
+            bio=tp.get("bio") or "",
+            subjects=tp.get("subjects") or [],
+            availability=tp.get("availability") or [],
+            scheduling_link=tp.get("scheduling_link"),
+            is_verified=tp.get("transcript_verification_status") == "verified",
+            transcript_verification_status=tp.get("transcript_verification_status"),
+            transcript_verified_at=tp.get("transcript_verified_at"),
+            stats=tutor_stats_out(tp.get("profiles")),
+        )
     except Exception as e:
         raise HTTPException(status_code=404, detail="Tutor not found")
 
+# ---------------------------
+# Subject Ranking Endpoints
+# ---------------------------
+def normalize_subject(subject: str) -> str:
+    """Normalize a course code the same way as normalize_subject() in the schema."""
+    return " ".join(subject.split()).upper()
+
+@app.get("/subjects/{subject}/tutors", response_model=List[RankedTutorOut])
+def get_subject_tutors(
+    subject: str,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+):
+    """
+    Get tutors for an exact subject (e.g. 'MATH 156'), best first.
+    Served from the precomputed subject_tutor_rankings table, ordered by
+    verification status, verified grade in that subject and responsiveness.
+    """
+    if not supabase:
+        raise HTTPException(status_code=500, detail="Supabase not configured")
+    
+    try:
+        response = supabase.table("subject_tutor_rankings").select(
+            "tutor_id, is_verified, grade_points, responsiveness, tutor_profiles(bio, subjects, availability, profiles(name))"
+        ).eq(
+            "subject", normalize_subject(subject)
+        ).order(
+            "is_verified", desc=True
+        ).order(
+            "grade_points", desc=True
+        ).order(
+            "responsiveness", desc=True
+        ).range(offset, offset + limit - 1).execute()
+        
+        results = []
+        for row in response.data:
+            tp = row.get("tutor_profiles") or {}
+            results.append(RankedTutorOut(
+                tutor_id=row["tutor_id"],
+                name=(tp.get("profiles") or {}).get("name", "Unknown"),
+                bio=tp.get("bio") or "",
+                subjects=tp.get("subjects") or [],
+                availability=tp.get("availability") or [],
+                is_verified=row.get("is_verified", False),
+                grade_points=row.get("grade_points") or 0,
+                responsiveness=row.get("responsiveness") or 0,
+            ))
+        
+        return results
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error getting subject tutors: {str(e)}")
+
 # ---------------------------
 # Transcript Upload & Verification Endpoints
 # ---------------------------
+def transcript_storage_path(file_content: bytes, content_type: str) -> str:
+    """Build the content-addressed storage path for a transcript."""
+    digest = hashlib.sha256(file_content).hexdigest()
+    return f"{TRANSCRIPT_HASH_PREFIX}/{digest}.{TRANSCRIPT_EXTENSIONS[content_type]}"
+
+def transcript_is_referenced(storage_path: str) -> bool:
+    """Check whether any tutor profile already points at a stored transcript."""
+    response = supabase.table("tutor_profiles").select("id").eq(
+        "transcript_file_url", storage_path
+    ).limit(1).execute()
+    return bool(response.data)
+
 @app.post("/tutors/transcript/upload")
 async def upload_transcript(
     file: UploadFile = File(...),
@@ -338,20 +1046,22 @@ async def upload_transcript(
             detail=f"File too large. Maximum size: {MAX_TRANSCRIPT_SIZE // (1024*1024)}MB"
         )
     
-    # Generate unique filename
-    file_ext = file.filename.split(".")[-1] if file.filename else "pdf"
-    storage_path = f"{user_id}/{uuid.uuid4()}.{file_ext}"
+    # Content-addressed path: the same bytes always map to the same object
+    storage_path = transcript_storage_path(file_content, content_type)
     
     try:
-        # Upload to Supabase Storage
-        storage_response = supabase.storage.from_(TRANSCRIPT_BUCKET).upload(
-            path=storage_path,
-            file=file_content,
-            file_options={"content-type": content_type}
-        )
-        
-        # Get the public URL (or signed URL for private buckets)
-        file_url = supabase.storage.from_(TRANSCRIPT_BUCKET).get_public_url(storage_path)
+        # Skip the Storage write if this exact file is already stored
+        if not transcript_is_referenced(storage_path):
+            try:
+                supabase.storage.from_(TRANSCRIPT_BUCKET).upload(
+                    path=storage_path,
+                    file=file_content,
+                    file_options={"content-type": content_type}
+                )
+            except StorageException as e:
+                # Stored but not referenced (yet) - e.g. a concurrent upload of the same file
+                if "Duplicate" not in str(e) and "already exists" not in str(e):
+                    raise
         
         # Update tutor profile with transcript info
         supabase.table("tutor_profiles").update({
@@ -371,29 +1081,142 @@ async def upload_transcript(
         raise HTTPException(status_code=500, detail=f"Error uploading transcript: {str(e)}")
 
 
-@app.post("/tutors/transcript/verify")
-async def verify_transcript(
-    current_user: dict = Depends(get_current_user),
-):
+def run_verification_stage(model: str, detail: str, prompt: str, image_url: str) -> tuple[Optional[dict], dict]:
     """
-    Trigger AI verification of the uploaded transcript.
-    Requires tutor role and a previously uploaded transcript.
+    Ask one model to grade the transcript image.
+    Returns the parsed verification result (None if the model refused or was
+    cut off) and a record of the stage (model, image detail, latency, token
+    usage and estimated cost).
     """
-    if not supabase:
-        raise HTTPException(status_code=500, detail="Supabase not configured")
+    started = time.monotonic()
+    response = create_chat_completion(
+        model=model,
+        messages=[
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": prompt},
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": image_url,
+                            "detail": detail
+                        }
+                    }
+                ]
+            }
+        ],
+        max_tokens=2000,
+        response_format={
+            "type": "json_schema",
+            "json_schema": {
+                "name": "transcript_verification",
+                "strict": True,
+                "schema": TRANSCRIPT_VERIFICATION_SCHEMA,
+            },
+        },
+    )
     
-    if not openai_client:
-        raise HTTPException(status_code=500, detail="OpenAI not configured - cannot verify transcripts")
+    stage = {
+        "model": model,
+        "detail": detail,
+        "latency_ms": int((time.monotonic() - started) * 1000),
+        "prompt_tokens": None,
+        "completion_tokens": None,
+        "cost_usd": None,
+    }
+    usage = getattr(response, "usage", None)
+    if usage:
+        stage["prompt_tokens"] = usage.prompt_tokens
+        stage["completion_tokens"] = usage.completion_tokens
+        prices = OPENAI_PRICES_PER_MILLION.get(model)
+        if prices:
+            stage["cost_usd"] = round(
+                (usage.prompt_tokens * prices[0] + usage.completion_tokens * prices[1]) / 1_000_000, 6
+            )
     
-    user_id = current_user.get("sub")
+    # Parse the response - structured output guarantees schema-valid JSON
+    # unless the model refused or ran out of tokens; those come back as None so
+    # the caller still gets the stage's latency, tokens and cost
+    choice = response.choices[0]
+    if choice.message.refusal or choice.finish_reason == "length" or not choice.message.content:
+        stage["error"] = "unusable response"
+        return None, stage
     
-    # Verify user has tutor role
-    if not user_has_role(user_id, "tutor"):
-        raise HTTPException(
-            status_code=403,
-            detail="Only tutors can verify transcripts"
-        )
+    return json.loads(choice.message.content), stage
+
+def cascade_escalation_reasons(verification_data: dict, tutor_subjects: List[str]) -> List[str]:
+    """
+    Decide whether a first-pass result is confident enough to keep.
+    Returns the reasons to escalate to the full model (empty list = keep it).
+    """
+    reasons = []
+    
+    score = verification_data.get("authenticity_score") or 0
+    if VERIFY_ESCALATE_AUTHENTICITY[0] <= score <= VERIFY_ESCALATE_AUTHENTICITY[1]:
+        reasons.append(f"borderline authenticity_score {score}")
+    elif verification_data.get("overall_status") == "verified" and score < 0.7:
+        reasons.append(f"verified despite authenticity_score {score}")
+
+    claimed = {normalize_subject(subject) for subject in tutor_subjects}
+    matched = [c for c in verification_data.get("verified_courses", []) if c.get("matches_subject")]
+    if claimed and not matched:
+        reasons.append("no course matched a tutor subject")
+    # A subject with one course clearly above the cutoff is settled: a misread grade in
+    # another of its courses changes neither the outcome nor its ranking (the best grade)
+    settled = {
+        normalize_subject(c["matches_subject"]) for c in matched
+        if c.get("grade_points") is not None and c["grade_points"] > 3.3 + VERIFY_ESCALATE_GRADE_MARGIN
+    }
+    for course in matched:
+        subject = normalize_subject(course["matches_subject"])
+        if subject not in claimed:
+            reasons.append(f"matched unknown subject {course['matches_subject']}")
+        if subject in settled:
+            continue
+        grade_points = course.get("grade_points")
+        if grade_points is None:
+            reasons.append(f"no grade points for {course.get('course_name')}")
+        elif abs(grade_points - 3.3) <= VERIFY_ESCALATE_GRADE_MARGIN:
+            reasons.append(f"grade {course.get('grade')} near the B+ cutoff for {course.get('course_name')}")
     
+    return reasons
+
+def record_verification_run(user_id: str, status: str, stages: List[dict]):
+    """
+    Store one verification run's cascade metrics in transcript_verifications.
+    Kept out of transcript_verification_data, which tutors can read: the
+    escalation thresholds and spend are internal. Never fails the verification.
+    """
+    try:
+        supabase.table("transcript_verifications").insert({
+            "tutor_id": user_id,
+            "status": status,
+            "escalated": len(stages) > 1,
+            "stages": stages,
+            "thresholds": {
+                "cascade": VERIFY_CASCADE,
+                "first_pass_model": VERIFY_FIRST_PASS_MODEL,
+                "first_pass_detail": VERIFY_FIRST_PASS_DETAIL,
+                "full_model": VERIFY_FULL_MODEL,
+                "full_detail": VERIFY_FULL_DETAIL,
+                "authenticity_band": list(VERIFY_ESCALATE_AUTHENTICITY),
+                "grade_cutoff": 3.3,
+                "grade_margin": VERIFY_ESCALATE_GRADE_MARGIN,
+            },
+            "total_latency_ms": sum(st["latency_ms"] for st in stages),
+            "total_cost_usd": round(sum(st["cost_usd"] or 0 for st in stages), 6),
+        }).execute()
+    except Exception as e:
+        print(f"Warning: could not record transcript verification for {user_id}: {e}")
+
+def run_transcript_verification(user_id: str) -> dict:
+    """
+    Run AI verification for a tutor's uploaded transcript and store the result.
+    Downloads the transcript, renders PDFs to an image, asks OpenAI to grade it
+    and updates the tutor profile. Shared by the verify endpoint and the bulk
+    re-verification command (reverify.py); callers check configuration and roles.
+    """
     # Get tutor profile with transcript info
     try:
         tutor_response = supabase.table("tutor_profiles").select(
@@ -504,59 +1327,43 @@ Verification criteria:
 4. Set overall_status to "verified" if:
    - At least one course matches a tutor subject with grade B+ or higher
    - Authenticity score is 0.7 or higher
-5. Set overall_status to "rejected" otherwise, with a clear rejection_reason
-
-IMPORTANT: Return ONLY valid JSON, no markdown or other formatting."""
+5. Set overall_status to "rejected" otherwise, with a clear rejection_reason"""
 
+    image_url = f"data:{mime_type};base64,{base64_image}"
+    
     try:
-        # Call OpenAI Vision API
-        response = openai_client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": verification_prompt},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:{mime_type};base64,{base64_image}",
-                                "detail": "high"
-                            }
-                        }
-                    ]
-                }
-            ],
-            max_tokens=2000,
-        )
-        
-        # Parse the response
-        ai_response = response.choices[0].message.content
+        # Cheap first pass; escalate to the full model only when its answer is uncertain
+        stages = []
+        verification_data = None
+        if VERIFY_CASCADE:
+            first_pass, stage = run_verification_stage(
+                VERIFY_FIRST_PASS_MODEL, VERIFY_FIRST_PASS_DETAIL, verification_prompt, image_url
+            )
+            if first_pass is None:
+                stage["escalation_reasons"] = [stage["error"]]
+            else:
+                stage["escalation_reasons"] = cascade_escalation_reasons(first_pass, tutor_subjects)
+            stages.append(stage)
+            if not stage["escalation_reasons"]:
+                verification_data = first_pass
         
-        # Try to parse as JSON
-        try:
-            # Clean up response if it has markdown code blocks
-            if "```json" in ai_response:
-                ai_response = ai_response.split("```json")[1].split("```")[0]
-            elif "```" in ai_response:
-                ai_response = ai_response.split("```")[1].split("```")[0]
-            
-            verification_data = json.loads(ai_response.strip())
-        except json.JSONDecodeError:
-            # If parsing fails, create a default rejected response
-            verification_data = {
-                "verified_courses": [],
-                "authenticity_score": 0,
-                "authenticity_notes": "Failed to parse transcript",
-                "overall_status": "rejected",
-                "rejection_reason": "Could not analyze the transcript image. Please upload a clearer image.",
-                "summary": "Verification failed due to image quality or format"
-            }
+        if verification_data is None:
+            verification_data, stage = run_verification_stage(
+                VERIFY_FULL_MODEL, VERIFY_FULL_DETAIL, verification_prompt, image_url
+            )
+            stages.append(stage)
+            if verification_data is None:
+                record_verification_run(user_id, "error", stages)
+                raise HTTPException(
+                    status_code=502,
+                    detail="Could not analyze the transcript. Please try again or upload a clearer image."
+                )
         
         # Determine final status
         final_status = verification_data.get("overall_status", "rejected")
         if final_status not in ["verified", "rejected"]:
             final_status = "rejected"
+        record_verification_run(user_id, final_status, stages)
         
         # Update tutor profile with verification results
         supabase.table("tutor_profiles").update({
@@ -571,10 +1378,38 @@ IMPORTANT: Return ONLY valid JSON, no markdown or other formatting."""
             "verification_data": verification_data
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error during verification: {str(e)}")
 
 
+@app.post("/tutors/transcript/verify")
+def verify_transcript(
+    current_user: dict = Depends(get_current_user),
+):
+    """
+    Trigger AI verification of the uploaded transcript.
+    Requires tutor role and a previously uploaded transcript.
+    """
+    if not supabase:
+        raise HTTPException(status_code=500, detail="Supabase not configured")
+    
+    if not openai_client:
+        raise HTTPException(status_code=500, detail="OpenAI not configured - cannot verify transcripts")
+    
+    user_id = current_user.get("sub")
+    
+    # Verify user has tutor role
+    if not user_has_role(user_id, "tutor"):
+        raise HTTPException(
+            status_code=403,
+            detail="Only tutors can verify transcripts"
+        )
+    
+    return run_transcript_verification(user_id)
+
+
 @app.get("/tutors/transcript/status")
 def get_transcript_status(
     current_user: dict = Depends(get_current_user),
@@ -653,10 +1488,46 @@ def create_help_request(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating request: {str(e)}")
 
-@app.get("/help-requests")
+def iter_help_requests(rows: list, view_role: str) -> Iterator[HelpReqOut]:
+    """
+    Yield help requests with the counterpart's name attached.
+    Students see the tutor's name, tutors see the student's name.
+    """
+    for hr in rows:
+        item = HelpReqOut(
+            id=hr["id"],
+            subject=hr["subject"],
+            description=hr.get("description") or "",
+            status=hr["status"],
+            preferred_times=hr.get("preferred_times") or [],
+            created_at=hr.get("created_at"),
+        )
+        
+        # Fetch names separately using the IDs
+        if view_role == "student":
+            # Get tutor name
+            item.tutor_id = hr["tutor_id"]
+            try:
+                tutor_profile = supabase.table("profiles").select("name").eq("id", hr["tutor_id"]).single().execute()
+                item.tutor_name = tutor_profile.data.get("name", "Unknown") if tutor_profile.data else "Unknown"
+            except:
+                item.tutor_name = "Unknown"
+        else:
+            # Get student name
+            item.student_id = hr["student_id"]
+            try:
+                student_profile = supabase.table("profiles").select("name").eq("id", hr["student_id"]).single().execute()
+                item.student_name = student_profile.data.get("name", "Unknown") if student_profile.data else "Unknown"
+            except:
+                item.student_name = "Unknown"
+        
+        yield item
+
+@app.get("/help-requests", response_model=List[HelpReqOut], response_model_exclude_unset=True)
 def list_help_requests(
     status: Optional[str] = Query(None),
     as_role: Optional[str] = Query(None, description="View requests as 'student' or 'tutor'"),
+    stream: bool = Query(False, description="Stream results as NDJSON (one request per line)"),
     current_user: dict = Depends(get_current_user),
 ):
     """
@@ -700,38 +1571,12 @@ def list_help_requests(
         
         response = query.order("created_at", desc=True).execute()
         
-        items = []
-        for hr in response.data:
-            item = {
-                "id": hr["id"],
-                "subject": hr["subject"],
-                "description": hr.get("description", ""),
-                "status": hr["status"],
-                "preferred_times": hr.get("preferred_times") or [],
-                "created_at": hr.get("created_at"),
-            }
-            
-            # Fetch names separately using the IDs
-            if view_role == "student":
-                # Get tutor name
-                item["tutor_id"] = hr["tutor_id"]
-                try:
-                    tutor_profile = supabase.table("profiles").select("name").eq("id", hr["tutor_id"]).single().execute()
-                    item["tutor_name"] = tutor_profile.data.get("name", "Unknown") if tutor_profile.data else "Unknown"
-                except:
-                    item["tutor_name"] = "Unknown"
-            else:
-                # Get student name
-                item["student_id"] = hr["student_id"]
-                try:
-                    student_profile = supabase.table("profiles").select("name").eq("id", hr["student_id"]).single().execute()
-                    item["student_name"] = student_profile.data.get("name", "Unknown") if student_profile.data else "Unknown"
-                except:
-                    item["student_name"] = "Unknown"
-            
-            items.append(item)
+        items = iter_help_requests(response.data, view_role)
+        if stream:
+            # Names are looked up per row, so streaming lets early rows go out first
+            return ndjson_response(items)
         
-        return items
+        return list(items)
     except HTTPException:
         raise
     except Exception as e:
@@ -0,0 +1,273 @@
+# reverify.py — Bulk transcript re-verification (admin command)
+# Re-runs the same verification the /tutors/transcript/verify endpoint uses
+# for every tutor whose transcript is pending or verified, e.g. after the
+# verification prompt or model changes.
+#
+# Usage (from the api/ directory, with the same .env as the API):
+#   python reverify.py --run-label prompt-v2 --dry-run
+#   python reverify.py --run-label prompt-v2 --concurrency 8
+#   python reverify.py --run-label prompt-v2 --resume    # after a crash
+#
+# Each finished tutor is appended to the checkpoint log. --resume continues
+# the run recorded there (the run label must match); without it a new run
+# starts and the old log is replaced.
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, AsyncIterator
+
+from fastapi import HTTPException
+
+import main
+
+DEFAULT_STATUSES = ["pending", "verified"]
+DEFAULT_CHECKPOINT = ".reverify-checkpoint.jsonl"
+
+
+# ---------------------------
+# Checkpoint
+# ---------------------------
+class Checkpoint:
+    """
+    Append-only log of re-verified tutors, one JSON object per line.
+    The first line records the run label so a log is only resumed by the
+    run that wrote it. Tutors that failed are recorded but retried on resume.
+    """
+
+    def __init__(self, path: str, run_label: str, resume: bool):
+        self.path = path
+        self.done: set = set()
+        self.failed: dict = {}
+
+        if resume and os.path.exists(path):
+            self.done, self.failed = self.read(path, run_label)
+            self._log = open(path, "a")
+        else:
+            self._log = open(path, "w")
+            self._append({"run": run_label, "started_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())})
+
+    @staticmethod
+    def read(path: str, run_label: str) -> tuple:
+        """
+        Read a checkpoint log without opening it for writing.
+        Returns (done ids, failed id -> reason); empty if the log doesn't exist.
+        """
+        done: set = set()
+        failed: dict = {}
+        if not os.path.exists(path):
+            return done, failed
+
+        with open(path) as f:
+            lines = f.read().splitlines()
+        header = json.loads(lines[0]) if lines else {}
+        if header.get("run") != run_label:
+            raise SystemExit(
+                f"Checkpoint {path} belongs to run {header.get('run')!r}, not {run_label!r}"
+            )
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash can leave a partial last line
+                continue
+            if entry.get("done"):
+                done.add(entry["id"])
+                failed.pop(entry["id"], None)
+            else:
+                failed[entry["id"]] = entry.get("reason")
+        return done, failed
+
+    def mark_done(self, tutor_id: str):
+        self.done.add(tutor_id)
+        self.failed.pop(tutor_id, None)
+        self._append({"id": tutor_id, "done": True})
+
+    def mark_failed(self, tutor_id: str, reason: str):
+        self.failed[tutor_id] = reason
+        self._append({"id": tutor_id, "done": False, "reason": reason})
+
+    def _append(self, entry: dict):
+        self._log.write(json.dumps(entry) + "\n")
+        self._log.flush()
+
+    def close(self):
+        self._log.close()
+
+
+# ---------------------------
+# Tutor Paging
+# ---------------------------
+async def iter_tutor_ids(statuses: List[str], page_size: int) -> AsyncIterator[str]:
+    """
+    Stream ids of tutors with an uploaded transcript in the given statuses.
+    Uses keyset pagination on id, so rows changing status while we run
+    (as re-verification does) never shift or skip pages.
+    """
+    last_id: Optional[str] = None
+    while True:
+        query = main.supabase.table("tutor_profiles").select("id").in_(
+            "transcript_verification_status", statuses
+        ).not_.is_("transcript_file_url", "null")
+        if last_id:
+            query = query.gt("id", last_id)
+
+        response = await asyncio.to_thread(
+            query.order("id").limit(page_size).execute
+        )
+        rows = response.data or []
+        for row in rows:
+            yield row["id"]
+
+        if len(rows) < page_size:
+            return
+        last_id = rows[-1]["id"]
+
+
+# ---------------------------
+# Worker Pool
+# ---------------------------
+class Stats:
+    def __init__(self):
+        self.started = time.monotonic()
+        self.processed = 0
+        self.skipped = 0
+        self.failed = 0
+        self.by_status: dict = {}
+
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self.started
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        elapsed = time.monotonic() - self.started
+        statuses = ", ".join(f"{k}={v}" for k, v in sorted(self.by_status.items())) or "none"
+        return (
+            f"processed={self.processed} failed={self.failed} skipped={self.skipped} "
+            f"[{statuses}] in {elapsed:.1f}s ({self.rate():.2f} tutors/s)"
+        )
+
+
+async def worker(
+    queue: asyncio.Queue,
+    executor: ThreadPoolExecutor,
+    checkpoint: Checkpoint,
+    stats: Stats,
+    report_every: int,
+):
+    loop = asyncio.get_running_loop()
+    while True:
+        tutor_id = await queue.get()
+        try:
+            # Same code path as POST /tutors/transcript/verify
+            result = await loop.run_in_executor(executor, main.run_transcript_verification, tutor_id)
+            status = result.get("status", "unknown")
+            stats.by_status[status] = stats.by_status.get(status, 0) + 1
+            checkpoint.mark_done(tutor_id)
+        except HTTPException as e:
+            stats.failed += 1
+            checkpoint.mark_failed(tutor_id, str(e.detail))
+            print(f"  ! {tutor_id}: {e.detail}")
+        except Exception as e:
+            stats.failed += 1
+            checkpoint.mark_failed(tutor_id, str(e))
+            print(f"  ! {tutor_id}: {e}")
+        finally:
+            stats.processed += 1
+            if stats.processed % report_every == 0:
+                print(f"  ... {stats.summary()}")
+            queue.task_done()
+
+
+async def reverify(
+    statuses: List[str],
+    concurrency: int,
+    page_size: int,
+    checkpoint_path: str,
+    run_label: str,
+    resume: bool,
+    dry_run: bool,
+    report_every: int,
+):
+    stats = Stats()
+
+    if dry_run:
+        # Read the checkpoint without starting a new run (which would replace it)
+        done = Checkpoint.read(checkpoint_path, run_label)[0] if resume else set()
+        pending = 0
+        async for tutor_id in iter_tutor_ids(statuses, page_size):
+            if tutor_id in done:
+                stats.skipped += 1
+                continue
+            pending += 1
+            print(f"  would re-verify {tutor_id}")
+        print(f"Dry run: {pending} tutors to re-verify, {stats.skipped} already done")
+        return stats
+
+    checkpoint = Checkpoint(checkpoint_path, run_label, resume)
+    if checkpoint.done:
+        print(f"Resuming run {run_label!r} from {checkpoint_path}: {len(checkpoint.done)} tutors already re-verified")
+
+    # Bounded queue keeps at most a couple of pages in memory ahead of the workers
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    # One thread per worker; asyncio's default executor would silently cap
+    # --concurrency at min(32, cpus + 4)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="reverify")
+    workers = [
+        asyncio.create_task(worker(queue, executor, checkpoint, stats, report_every))
+        for _ in range(concurrency)
+    ]
+
+    async for tutor_id in iter_tutor_ids(statuses, page_size):
+        if tutor_id in checkpoint.done:
+            stats.skipped += 1
+            continue
+        await queue.put(tutor_id)
+
+    await queue.join()
+    for w in workers:
+        w.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    executor.shutdown()
+    checkpoint.close()
+
+    print(f"Done: {stats.summary()}")
+    return stats
+
+
+def cli():
+    parser = argparse.ArgumentParser(description="Re-verify tutor transcripts in bulk")
+    parser.add_argument("--status", action="append", choices=["pending", "verified", "rejected"],
+                        help="Verification status to re-verify (repeatable, default: pending and verified)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Number of verifications in flight")
+    parser.add_argument("--page-size", type=int, default=100, help="Tutors fetched per page")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT, help="Checkpoint log file")
+    parser.add_argument("--run-label", required=True,
+                        help="Name for this re-verification (e.g. the prompt or model version); --resume must match it")
+    parser.add_argument("--resume", action="store_true", help="Continue the run recorded in the checkpoint")
+    parser.add_argument("--report-every", type=int, default=25, help="Print throughput every N tutors")
+    parser.add_argument("--dry-run", action="store_true", help="List tutors that would be re-verified")
+    args = parser.parse_args()
+
+    if not main.supabase:
+        raise SystemExit("Supabase not configured")
+    if not main.openai_client and not args.dry_run:
+        raise SystemExit("OpenAI not configured - cannot verify transcripts")
+
+    asyncio.run(reverify(
+        statuses=args.status or DEFAULT_STATUSES,
+        concurrency=max(1, args.concurrency),
+        page_size=max(1, args.page_size),
+        checkpoint_path=args.checkpoint,
+        run_label=args.run_label,
+        resume=args.resume,
+        dry_run=args.dry_run,
+        report_every=max(1, args.report_every),
+    ))
+
+
+if __name__ == "__main__":
+    cli()
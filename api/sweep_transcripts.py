@@ -0,0 +1,137 @@
+# sweep_transcripts.py — Delete orphaned transcript files (admin command)
+# Removes objects in the transcripts bucket that no tutor_profiles row
+# references any more (replaced re-uploads, deleted tutors). Meant to run
+# periodically, e.g. from a nightly cron job.
+#
+# Usage (from the api/ directory, with the same .env as the API):
+#   python sweep_transcripts.py --dry-run
+#   python sweep_transcripts.py --min-age-hours 24
+
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional
+
+import main
+
+LIST_PAGE_SIZE = 1000
+
+
+def referenced_transcript_paths(page_size: int) -> set:
+    """Collect every transcript_file_url still referenced by a tutor profile."""
+    paths = set()
+    last_id: Optional[str] = None
+    while True:
+        query = main.supabase.table("tutor_profiles").select("id, transcript_file_url").not_.is_(
+            "transcript_file_url", "null"
+        )
+        if last_id:
+            query = query.gt("id", last_id)
+        rows = query.order("id").limit(page_size).execute().data or []
+        paths.update(row["transcript_file_url"] for row in rows)
+        if len(rows) < page_size:
+            return paths
+        last_id = rows[-1]["id"]
+
+
+def still_referenced(paths: list) -> set:
+    """Return which of `paths` a tutor profile references right now."""
+    rows = main.supabase.table("tutor_profiles").select("transcript_file_url").in_(
+        "transcript_file_url", paths
+    ).execute().data or []
+    return {row["transcript_file_url"] for row in rows}
+
+
+def list_objects(prefix: str = "") -> Iterator[dict]:
+    """
+    Walk the transcripts bucket, yielding file entries with their full path.
+    Folders (content-hash prefix, legacy per-user folders) are walked recursively.
+    """
+    bucket = main.supabase.storage.from_(main.TRANSCRIPT_BUCKET)
+    offset = 0
+    while True:
+        entries = bucket.list(prefix or None, {
+            "limit": LIST_PAGE_SIZE,
+            "offset": offset,
+            "sortBy": {"column": "name", "order": "asc"},
+        })
+        for entry in entries:
+            path = f"{prefix}/{entry['name']}" if prefix else entry["name"]
+            if entry.get("id") is None:
+                # Folders have no object id
+                yield from list_objects(path)
+            else:
+                yield {**entry, "path": path}
+        if len(entries) < LIST_PAGE_SIZE:
+            return
+        offset += LIST_PAGE_SIZE
+
+
+def is_older_than(entry: dict, cutoff: datetime) -> bool:
+    created_at = entry.get("created_at")
+    if not created_at:
+        return True
+    try:
+        return datetime.fromisoformat(created_at.replace("Z", "+00:00")) < cutoff
+    except ValueError:
+        return False
+
+
+def sweep(batch_size: int, min_age_hours: float, dry_run: bool) -> int:
+    started = time.monotonic()
+    # Objects uploaded just before their profile row is updated look orphaned;
+    # the age cutoff keeps the sweeper from racing in-progress uploads
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=min_age_hours)
+
+    referenced = referenced_transcript_paths(batch_size)
+    print(f"{len(referenced)} transcripts referenced by tutor profiles")
+
+    bucket = main.supabase.storage.from_(main.TRANSCRIPT_BUCKET)
+    scanned = 0
+    orphaned = []
+    for entry in list_objects():
+        scanned += 1
+        if entry["path"] not in referenced and is_older_than(entry, cutoff):
+            orphaned.append(entry["path"])
+
+    removed = 0
+    for i in range(0, len(orphaned), batch_size):
+        batch = orphaned[i:i + batch_size]
+        # Content-addressed paths get reused: an upload of an old, unreferenced file
+        # hits Duplicate and points a profile at the existing object, possibly after
+        # `referenced` was built. Re-check right before deleting.
+        now_referenced = still_referenced(batch)
+        batch = [path for path in batch if path not in now_referenced]
+        if not batch:
+            continue
+        if dry_run:
+            for path in batch:
+                print(f"  would delete {path}")
+        else:
+            bucket.remove(batch)
+        removed += len(batch)
+
+    action = "Would delete" if dry_run else "Deleted"
+    print(f"{action} {removed} of {scanned} objects in {time.monotonic() - started:.1f}s")
+    return removed
+
+
+def cli():
+    parser = argparse.ArgumentParser(description="Delete transcript files no tutor profile references")
+    parser.add_argument("--batch-size", type=int, default=100, help="Objects deleted per Storage call")
+    parser.add_argument("--min-age-hours", type=float, default=24, help="Only delete objects older than this")
+    parser.add_argument("--dry-run", action="store_true", help="List orphaned objects without deleting them")
+    args = parser.parse_args()
+
+    if not main.supabase:
+        raise SystemExit("Supabase not configured")
+
+    sweep(
+        batch_size=max(1, args.batch_size),
+        min_age_hours=max(0, args.min_age_hours),
+        dry_run=args.dry_run,
+    )
+
+
+if __name__ == "__main__":
+    cli()
@@ -175,3 +175,369 @@ create index if not exists idx_help_requests_student on help_requests(student_id
 create index if not exists idx_help_requests_tutor on help_requests(tutor_id);
 create index if not exists idx_help_requests_status on help_requests(status);
 create index if not exists idx_tutor_profiles_verification_status on tutor_profiles(transcript_verification_status);
+
+-- ============================================
+-- 6. SUBJECT RANKINGS
+-- Precomputed subject -> ranked tutor lists, served by /subjects/{subject}/tutors.
+-- Kept up to date per tutor by triggers on tutor_profiles and help_requests,
+-- so subject pages read an index range instead of scanning every tutor.
+-- ============================================
+create or replace function normalize_subject(subject text)
+returns text as $$
+  select upper(regexp_replace(trim(subject), '\s+', ' ', 'g'));
+$$ language sql immutable;
+
+create table if not exists subject_tutor_rankings (
+  subject text not null, -- normalize_subject() of a tutor_profiles.subjects entry
+  tutor_id uuid references tutor_profiles on delete cascade not null,
+  is_verified boolean not null default false,
+  grade_points numeric not null default 0, -- Best verified grade for this subject, 0 if unknown
+  responsiveness numeric not null default 0, -- Share of answered-or-closed requests the tutor accepted or declined (from tutor_stats)
+  updated_at timestamptz default now(),
+  primary key (subject, tutor_id)
+);
+
+alter table subject_tutor_rankings enable row level security;
+
+create policy "Anyone can view subject rankings"
+  on subject_tutor_rankings for select
+  using (true);
+
+create policy "Service role can manage subject rankings"
+  on subject_tutor_rankings for all
+  using (auth.role() = 'service_role');
+
+create index if not exists idx_subject_tutor_rankings_rank
+  on subject_tutor_rankings(subject, is_verified desc, grade_points desc, responsiveness desc);
+create index if not exists idx_subject_tutor_rankings_tutor on subject_tutor_rankings(tutor_id);
+
+-- Rebuild one tutor's ranking rows (one per subject they teach)
+create or replace function refresh_subject_rankings(p_tutor_id uuid)
+returns void as $$
+begin
+  delete from subject_tutor_rankings where tutor_id = p_tutor_id;
+
+  insert into subject_tutor_rankings (subject, tutor_id, is_verified, grade_points, responsiveness, updated_at)
+  select
+    normalize_subject(s.subject),
+    tp.id,
+    coalesce(tp.transcript_verification_status = 'verified', false),
+    -- Grades only count from a verified transcript; a rejected one (e.g. likely
+    -- forged) must not outrank honest unverified tutors with its claimed grades
+    case when tp.transcript_verification_status = 'verified' then coalesce((
+      select max((c->>'grade_points')::numeric)
+      from jsonb_array_elements(
+        case when jsonb_typeof(tp.transcript_verification_data->'verified_courses') = 'array'
+          then tp.transcript_verification_data->'verified_courses' else '[]'::jsonb end
+      ) c
+      where jsonb_typeof(c->'grade_points') = 'number'
+        and normalize_subject(c->>'matches_subject') = normalize_subject(s.subject)
+    ), 0) else 0 end,
+    coalesce(r.responsiveness, 0),
+    now()
+  from tutor_profiles tp
+  cross join unnest(tp.subjects) as s(subject)
+  left join lateral (
+    -- Based on the tutor's first response, so closing a finished session doesn't
+    -- count against them; requests still pending are left out
+    select ts.responded_count::numeric / nullif(ts.total_requests - ts.pending_count, 0) as responsiveness
+    from tutor_stats ts
+    where ts.tutor_id = tp.id
+  ) r on true
+  where tp.id = p_tutor_id
+    and trim(s.subject) <> ''
+  on conflict (subject, tutor_id) do nothing;
+end;
+$$ language plpgsql security definer;
+
+create or replace function tutor_profiles_refresh_rankings()
+returns trigger as $$
+begin
+  perform refresh_subject_rankings(new.id);
+  return new;
+end;
+$$ language plpgsql security definer;
+
+create or replace function help_requests_refresh_rankings()
+returns trigger as $$
+begin
+  if tg_op in ('UPDATE', 'DELETE') then
+    perform refresh_subject_rankings(old.tutor_id);
+  end if;
+  if tg_op = 'INSERT' or (tg_op = 'UPDATE' and new.tutor_id is distinct from old.tutor_id) then
+    perform refresh_subject_rankings(new.tutor_id);
+  end if;
+  return null;
+end;
+$$ language plpgsql security definer;
+
+drop trigger if exists tutor_profiles_rankings on tutor_profiles;
+create trigger tutor_profiles_rankings
+  after insert or update of subjects, transcript_verification_status, transcript_verification_data
+  on tutor_profiles
+  for each row execute function tutor_profiles_refresh_rankings();
+
+-- Responsiveness is read from tutor_stats, so this must run after the help_requests_stats
+-- trigger (section 8). Postgres fires triggers for the same event in name order.
+drop trigger if exists help_requests_rankings on help_requests;
+drop trigger if exists help_requests_stats_rankings on help_requests;
+create trigger help_requests_stats_rankings
+  after insert or delete or update of status, tutor_id on help_requests
+  for each row execute function help_requests_refresh_rankings();
+
+-- ============================================
+-- 7. TUTOR DIRECTORY SYNC
+-- /tutors/snapshot and /tutors/changes?since=<version> let clients keep a
+-- local copy of the directory and fetch only profiles updated (by
+-- tutor_profiles.updated_at) or removed (by tombstone) since a version.
+-- updated_at is set at transaction start, not commit, so the API hands out
+-- versions lagged by DIRECTORY_SYNC_LAG_SECONDS to catch late commits.
+-- ============================================
+create table if not exists tutor_profile_tombstones (
+  tutor_id uuid primary key,
+  deleted_at timestamptz not null default now()
+);
+
+alter table tutor_profile_tombstones enable row level security;
+
+create policy "Anyone can view tutor profile tombstones"
+  on tutor_profile_tombstones for select
+  using (true);
+
+create policy "Service role can manage tutor profile tombstones"
+  on tutor_profile_tombstones for all
+  using (auth.role() = 'service_role');
+
+create index if not exists idx_tutor_profiles_updated_at on tutor_profiles(updated_at);
+create index if not exists idx_tutor_profile_tombstones_deleted_at on tutor_profile_tombstones(deleted_at);
+
+create or replace function record_tutor_profile_tombstone()
+returns trigger as $$
+begin
+  insert into tutor_profile_tombstones (tutor_id, deleted_at)
+  values (old.id, now())
+  on conflict (tutor_id) do update set deleted_at = excluded.deleted_at;
+  return old;
+end;
+$$ language plpgsql security definer;
+
+create or replace function clear_tutor_profile_tombstone()
+returns trigger as $$
+begin
+  delete from tutor_profile_tombstones where tutor_id = new.id;
+  return new;
+end;
+$$ language plpgsql security definer;
+
+-- Tutor names live on profiles, so a rename must also bump tutor_profiles.updated_at
+create or replace function touch_tutor_profile_on_rename()
+returns trigger as $$
+begin
+  update tutor_profiles set updated_at = now() where id = new.id;
+  return new;
+end;
+$$ language plpgsql security definer;
+
+drop trigger if exists tutor_profiles_tombstone on tutor_profiles;
+create trigger tutor_profiles_tombstone
+  after delete on tutor_profiles
+  for each row execute function record_tutor_profile_tombstone();
+
+drop trigger if exists tutor_profiles_clear_tombstone on tutor_profiles;
+create trigger tutor_profiles_clear_tombstone
+  after insert on tutor_profiles
+  for each row execute function clear_tutor_profile_tombstone();
+
+drop trigger if exists profiles_touch_tutor_profile on profiles;
+create trigger profiles_touch_tutor_profile
+  after update of name on profiles
+  for each row
+  when (old.name is distinct from new.name)
+  execute function touch_tutor_profile_on_rename();
+
+-- Content-addressed transcript lookups (upload dedupe)
+create index if not exists idx_tutor_profiles_transcript_file_url on tutor_profiles(transcript_file_url);
+
+-- ============================================
+-- 8. TUTOR STATS
+-- Per-tutor help request counters and a response-time histogram, kept up
+-- to date by triggers on help_requests so reads are a single-row lookup.
+-- Response-time histogram buckets (upper bounds, seconds):
+--   15m, 1h, 4h, 12h, 1d, 3d, 7d, and a final bucket for anything slower.
+-- Keep in sync with RESPONSE_TIME_BUCKETS in api/main.py.
+-- ============================================
+alter table help_requests add column if not exists responded_at timestamptz;
+alter table help_requests add column if not exists response_status text
+  check (response_status in ('accepted', 'declined'));
+comment on column help_requests.responded_at is 'When the tutor first accepted or declined the request';
+comment on column help_requests.response_status is 'The tutor''s first response (accepted or declined), kept after the request is closed';
+
+create table if not exists tutor_stats (
+  tutor_id uuid references profiles on delete cascade primary key,
+  total_requests integer not null default 0,
+  pending_count integer not null default 0,
+  accepted_count integer not null default 0,
+  declined_count integer not null default 0,
+  closed_count integer not null default 0,
+  responded_count integer not null default 0, -- Requests the tutor accepted or declined (ever)
+  accepted_responses integer not null default 0, -- Of those, how many were accepted
+  response_time_histogram integer[] not null default array_fill(0, array[8]),
+  updated_at timestamptz default now()
+);
+
+alter table tutor_stats enable row level security;
+
+create policy "Anyone can view tutor stats"
+  on tutor_stats for select
+  using (true);
+
+create policy "Service role can manage tutor stats"
+  on tutor_stats for all
+  using (auth.role() = 'service_role');
+
+create or replace function response_time_bucket(created_at timestamptz, responded_at timestamptz)
+returns integer as $$
+  select width_bucket(
+    extract(epoch from responded_at - created_at),
+    array[900, 3600, 14400, 43200, 86400, 259200, 604800]::numeric[]
+  ) + 1;
+$$ language sql immutable;
+
+-- Record when and how a request first leaves 'pending' for accepted/declined
+create or replace function help_requests_set_responded_at()
+returns trigger as $$
+begin
+  if new.responded_at is null
+     and new.status in ('accepted', 'declined')
+     and (tg_op = 'INSERT' or old.status = 'pending') then
+    new.responded_at = now();
+    new.response_status = new.status;
+  end if;
+  return new;
+end;
+$$ language plpgsql;
+
+-- Apply one request's contribution to its tutor's stats (sign = 1 to add, -1 to remove)
+create or replace function apply_tutor_stats(hr help_requests, sign integer)
+returns void as $$
+declare
+  bucket integer;
+begin
+  insert into tutor_stats (tutor_id) values (hr.tutor_id) on conflict (tutor_id) do nothing;
+
+  if hr.responded_at is not null then
+    bucket := response_time_bucket(hr.created_at, hr.responded_at);
+  end if;
+
+  update tutor_stats set
+    total_requests = total_requests + sign,
+    pending_count = pending_count + case when hr.status = 'pending' then sign else 0 end,
+    accepted_count = accepted_count + case when hr.status = 'accepted' then sign else 0 end,
+    declined_count = declined_count + case when hr.status = 'declined' then sign else 0 end,
+    closed_count = closed_count + case when hr.status = 'closed' then sign else 0 end,
+    responded_count = responded_count + case when hr.responded_at is not null then sign else 0 end,
+    accepted_responses = accepted_responses + case when hr.response_status = 'accepted' then sign else 0 end,
+    response_time_histogram = case
+      when bucket is null then response_time_histogram
+      else response_time_histogram[1:bucket - 1]
+        || (response_time_histogram[bucket] + sign)
+        || response_time_histogram[bucket + 1:8]
+    end,
+    updated_at = now()
+  where tutor_id = hr.tutor_id;
+end;
+$$ language plpgsql security definer;
+
+create or replace function help_requests_update_stats()
+returns trigger as $$
+begin
+  if tg_op in ('UPDATE', 'DELETE') then
+    perform apply_tutor_stats(old, -1);
+  end if;
+  if tg_op in ('INSERT', 'UPDATE') then
+    perform apply_tutor_stats(new, 1);
+  end if;
+  return null;
+end;
+$$ language plpgsql security definer;
+
+-- Replaces update_updated_at() on help_requests: an update that only sets
+-- responded_at/response_status (the backfill below) keeps updated_at, so
+-- re-running the backfill does not make every answered request look new
+create or replace function help_requests_update_updated_at()
+returns trigger as $$
+begin
+  if to_jsonb(new) - array['responded_at', 'response_status', 'updated_at']
+     = to_jsonb(old) - array['responded_at', 'response_status', 'updated_at'] then
+    new.updated_at = old.updated_at;
+  else
+    new.updated_at = now();
+  end if;
+  return new;
+end;
+$$ language plpgsql;
+
+drop trigger if exists help_requests_updated_at on help_requests;
+create trigger help_requests_updated_at
+  before update on help_requests
+  for each row execute function help_requests_update_updated_at();
+
+drop trigger if exists help_requests_responded_at on help_requests;
+create trigger help_requests_responded_at
+  before insert or update of status on help_requests
+  for each row execute function help_requests_set_responded_at();
+
+drop trigger if exists help_requests_stats on help_requests;
+create trigger help_requests_stats
+  after insert or delete or update of status, tutor_id, responded_at, response_status on help_requests
+  for each row execute function help_requests_update_stats();
+
+-- Backfill job: rebuild all tutor stats from help_requests.
+-- Safe to re-run; requests answered before responded_at existed use updated_at as their response time.
+create or replace function backfill_tutor_stats()
+returns void as $$
+begin
+  update help_requests set responded_at = updated_at, response_status = status
+  where responded_at is null and status in ('accepted', 'declined');
+
+  delete from tutor_stats;
+  perform apply_tutor_stats(hr, 1) from help_requests hr;
+end;
+$$ language plpgsql security definer;
+
+select backfill_tutor_stats();
+
+-- Backfill rankings for existing tutors (after tutor_stats, which they read)
+select refresh_subject_rankings(id) from tutor_profiles;
+
+-- ============================================
+-- 9. TRANSCRIPT VERIFICATIONS
+-- One row per AI verification run: which models ran, why the first pass
+-- escalated, latency, cost and the cascade thresholds in effect.
+-- Internal only (no tutor-readable policy); tutors see just the grading
+-- result in tutor_profiles.transcript_verification_data.
+-- ============================================
+create table if not exists transcript_verifications (
+  id uuid default gen_random_uuid() primary key,
+  tutor_id uuid references profiles on delete cascade not null,
+  status text not null check (status in ('verified', 'rejected', 'error')),
+  escalated boolean not null default false,
+  stages jsonb not null default '[]',
+  thresholds jsonb not null default '{}',
+  total_latency_ms integer not null default 0,
+  total_cost_usd numeric(12, 6) not null default 0,
+  created_at timestamptz default now()
+);
+
+alter table transcript_verifications enable row level security;
+
+create policy "Service role can manage transcript verifications"
+  on transcript_verifications for all
+  using (auth.role() = 'service_role');
+
+create index if not exists idx_transcript_verifications_created_at on transcript_verifications(created_at);
+create index if not exists idx_transcript_verifications_tutor_id on transcript_verifications(tutor_id);
+
+-- Cascade metrics used to be stored with the tutor-visible result; strip them
+update tutor_profiles set transcript_verification_data = transcript_verification_data - 'cascade'
+where transcript_verification_data ? 'cascade';